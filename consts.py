@@ -1,18 +1,42 @@
 """Shared constants for the PowerWash Simulator trainer."""
 
+import sys
+from enum import IntEnum
+
+
+class CheatId(IntEnum):
+    """Identifiers of the cheat features, usable as indices into a feature list."""
+
+    SOAP = 0
+    INSTANT_CLEAN = 1
+    FLIGHT = 2
+    DIRT_ESP = 3
+
+
 MENU_OPTIONS = {
     "1": "Toggle Infinite Soap",
     "2": "Toggle Instant Clean",
     "3": "Toggle Flight",
     "4": "Toggle Dirt ESP",
+    "r": "Refresh Addresses (after a level reload)",
     "q": "Quit",
 }
 
+# Full menu text including the input prompt, pre-encoded for a single write.
+MENU_BYTES: bytes = (
+    "\n=== Trippy's Deluxe Washer 2 ===\n"
+    + "".join(f"[{key}] {description}\n" for key, description in MENU_OPTIONS.items())
+    + "> "
+).encode("utf-8")
+
 CHEAT_NAMES = {
-    "soap": "Infinite Soap",
-    "instant_clean": "Instant Clean",
-    "flight": "Flight",
-    "dirt_esp": "Dirt ESP",
+    identifier: sys.intern(label)
+    for identifier, label in {
+        CheatId.SOAP: "Infinite Soap",
+        CheatId.INSTANT_CLEAN: "Instant Clean",
+        CheatId.FLIGHT: "Flight",
+        CheatId.DIRT_ESP: "Dirt ESP",
+    }.items()
 }
 
 # TODO: Add additional cheat identifiers here as new features are implemented.
@@ -0,0 +1,24 @@
+/*
+ * Native freeze loop for the Infinite Soap cheat.
+ *
+ * Rewrites a 32-bit value in the game process until *stop becomes non-zero.
+ * Loaded through ctypes by utility.MemoryFreezer; ctypes releases the GIL for
+ * the duration of the call so the menu stays responsive.
+ *
+ * Build (MSVC):  cl /LD /O2 freeze.c
+ * Build (MinGW): gcc -shared -O2 -o freeze.dll freeze.c
+ */
+#include <stdint.h>
+#include <windows.h>
+
+__declspec(dllexport) void freeze_loop(HANDLE process, uintptr_t address, int value,
+                                       volatile int *stop)
+{
+    SIZE_T written;
+
+    while (!*stop) {
+        if (!WriteProcessMemory(process, (LPVOID)address, &value, sizeof(value), &written))
+            return;
+        Sleep(16);
+    }
+}
@@ -7,8 +7,10 @@ memory-manipulation logic separate from the feature implementation.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -16,13 +18,21 @@ class MemoryAddress:
     """Simple container describing a static memory address and optional offsets."""
 
     base: int
-    offsets: List[int] = field(default_factory=list)
+    offsets: Tuple[int, ...] = ()
+    _described: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The chain is immutable, so format it once up front.
+        formatted_offsets = " -> ".join(f"0x{offset:08X}" for offset in self.offsets)
+        described = f"0x{self.base:08X}"
+        if formatted_offsets:
+            described += f" -> {formatted_offsets}"
+        object.__setattr__(self, "_described", described)
 
     def describe(self) -> str:
         """Return a human-readable description of the address chain."""
 
-        formatted_offsets = " -> ".join(f"0x{offset:08X}" for offset in self.offsets)
-        return f"0x{self.base:08X}" + (f" -> {formatted_offsets}" if formatted_offsets else "")
+        return self._described
 
 
 @dataclass(frozen=True)
@@ -45,14 +55,14 @@ PWS_V1_CONFIG = GameConfig(
     description="Original release of PowerWash Simulator on Windows",
     base_addresses={
         # TODO: Document original offsets in more detail once verified.
-        "currency": MemoryAddress(base=0x00000000, offsets=[]),
-        "soap": MemoryAddress(base=0x00000000, offsets=[]),
-        "dirt_level": MemoryAddress(base=0x00000000, offsets=[]),
-        "flight": MemoryAddress(base=0x00000000, offsets=[]),
+        "currency": MemoryAddress(base=0x00000000, offsets=()),
+        "soap": MemoryAddress(base=0x00000000, offsets=()),
+        "dirt_level": MemoryAddress(base=0x00000000, offsets=()),
+        "flight": MemoryAddress(base=0x00000000, offsets=()),
     },
     function_hooks={
-        "instant_clean": MemoryAddress(base=0x00000000, offsets=[]),
-        "dirt_esp": MemoryAddress(base=0x00000000, offsets=[]),
+        "instant_clean": MemoryAddress(base=0x00000000, offsets=()),
+        "dirt_esp": MemoryAddress(base=0x00000000, offsets=()),
     },
     notes="Placeholder values copied from the legacy trainer. Replace with the\n"
     " actual addresses when porting the old functionality.",
@@ -68,19 +78,19 @@ PWS_V2_CONFIG = GameConfig(
     description="Sequel release. All offsets below must be verified.",
     base_addresses={
         # TODO: Identify the new base pointer for player currency/money.
-        "currency": MemoryAddress(base=0x00000000, offsets=[]),
+        "currency": MemoryAddress(base=0x00000000, offsets=()),
         # TODO: Locate the consumable soap quantity structure.
-        "soap": MemoryAddress(base=0x00000000, offsets=[]),
+        "soap": MemoryAddress(base=0x00000000, offsets=()),
         # TODO: Determine the address chain that stores the current dirt level.
-        "dirt_level": MemoryAddress(base=0x00000000, offsets=[]),
+        "dirt_level": MemoryAddress(base=0x00000000, offsets=()),
         # TODO: Figure out how flight toggles are handled in PowerWash Simulator 2.
-        "flight": MemoryAddress(base=0x00000000, offsets=[]),
+        "flight": MemoryAddress(base=0x00000000, offsets=()),
     },
     function_hooks={
         # TODO: Update with the Instant Clean function hook once discovered.
-        "instant_clean": MemoryAddress(base=0x00000000, offsets=[]),
+        "instant_clean": MemoryAddress(base=0x00000000, offsets=()),
         # TODO: Update with the Dirt ESP function hook once discovered.
-        "dirt_esp": MemoryAddress(base=0x00000000, offsets=[]),
+        "dirt_esp": MemoryAddress(base=0x00000000, offsets=()),
     },
     notes=(
         "All addresses are placeholders. Replace them after scanning the sequel's\n"
@@ -89,10 +99,14 @@ PWS_V2_CONFIG = GameConfig(
 )
 
 
-SUPPORTED_GAMES: Dict[str, GameConfig] = {
-    "v1": PWS_V1_CONFIG,
-    "v2": PWS_V2_CONFIG,
-}
+SUPPORTED_GAMES: Mapping[str, GameConfig] = MappingProxyType(
+    {
+        sys.intern("v1"): PWS_V1_CONFIG,
+        sys.intern("v2"): PWS_V2_CONFIG,
+    }
+)
+
+SUPPORTED_GAME_CHOICES: Tuple[str, ...] = tuple(sorted(SUPPORTED_GAMES))
 
 
 def get_game_config(version: str) -> GameConfig:
@@ -109,8 +123,4 @@ def get_game_config(version: str) -> GameConfig:
         If the supplied version is not recognized.
     """
 
-    normalized = version.lower()
-    try:
-        return SUPPORTED_GAMES[normalized]
-    except KeyError as exc:  # pragma: no cover - defensive programming
-        raise KeyError(f"Unsupported game version '{version}'.") from exc
+    return SUPPORTED_GAMES[version.lower()]
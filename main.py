@@ -2,129 +2,223 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import logging
+import os
 import sys
-from dataclasses import dataclass
-from typing import Callable, Dict
-
-from consts import CHEAT_NAMES, MENU_OPTIONS
-from game_config import GameConfig, SUPPORTED_GAMES, get_game_config
-from utility import AttachedProcess, ProcessNotFoundError, attach_to_process, log_address_chain
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from consts import CHEAT_NAMES, MENU_BYTES, CheatId
+from game_config import SUPPORTED_GAME_CHOICES, GameConfig, get_game_config
+from utility import (
+    AttachedProcess,
+    MemoryAccessError,
+    ProcessNotFoundError,
+    ResolvedAddresses,
+    attach_to_process,
+    resolve_all,
+)
+
+if os.name == "nt":  # pragma: no cover - only exercised on Windows
+    import msvcrt
+else:
+    import select
+    import termios
+    import tty
 
 logger = logging.getLogger(__name__)
 
+KEY_POLL_TIMEOUT = 0.05  # seconds between background task pumps
+
 
-ToggleCallback = Callable[[AttachedProcess, GameConfig, bool], None]
+_STATE_STR = ("OFF", "ON")
 
+# Callbacks return ``True`` when the cheat was switched and ``False`` otherwise.
+ToggleCallback = Callable[[AttachedProcess, ResolvedAddresses, bool], bool]
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class CheatFeature:
     """Represents an individual cheat toggle."""
 
-    identifier: str
+    identifier: CheatId
     label: str
     callback: ToggleCallback
     enabled: bool = False
+    toggle_bound: Optional[Callable[[], None]] = field(default=None, init=False, repr=False)
 
-    def toggle(self, process: AttachedProcess, config: GameConfig) -> None:
+    def toggle(self, process: AttachedProcess, resolved: ResolvedAddresses) -> None:
+        if not self.callback(process, resolved, not self.enabled):
+            logger.warning(
+                "%s could not be switched; still %s", self.label, _STATE_STR[self.enabled]
+            )
+            return
         self.enabled = not self.enabled
-        logger.info("%s -> %s", self.label, "ON" if self.enabled else "OFF")
-        self.callback(process, config, self.enabled)
+        logger.info("%s -> %s", self.label, _STATE_STR[self.enabled])
 
 
 class CheatManager:
     """Container class that keeps track of all registered cheat features."""
 
-    def __init__(self, process: AttachedProcess, config: GameConfig) -> None:
+    def __init__(
+        self, process: AttachedProcess, config: GameConfig, resolved: ResolvedAddresses
+    ) -> None:
         self.process = process
         self.config = config
-        self.features: Dict[str, CheatFeature] = {}
-
-    def register(self, identifier: str, callback: ToggleCallback) -> None:
-        label = CHEAT_NAMES.get(identifier, identifier.title())
+        self.resolved = resolved
+        self.features: List[Optional[CheatFeature]] = [None] * len(CheatId)
+        self.dispatch: Callable[[CheatId], None] = self.toggle
+
+    def register(self, identifier: CheatId, callback: ToggleCallback) -> None:
+        label = CHEAT_NAMES.get(identifier)
+        if label is None:
+            label = sys.intern(identifier.name.replace("_", " ").title())
         self.features[identifier] = CheatFeature(identifier, label, callback)
 
-    def toggle(self, identifier: str) -> None:
-        feature = self.features.get(identifier)
-        if not feature:
-            logger.error("Unknown cheat '%s'", identifier)
+    def toggle(self, identifier: CheatId) -> None:
+        feature = self.features[identifier]
+        if feature is None:
+            self._report_unregistered(identifier)
             return
-        feature.toggle(self.process, self.config)
+        feature.toggle(self.process, self.resolved)
+
+    def compile_dispatch(self) -> None:
+        """Replace :attr:`dispatch` with a function specialized to the registered cheats.
+
+        Each registered feature gets its toggle pre-bound to the process and
+        resolved addresses, and the generated function branches straight to
+        it, skipping the feature lookup done by :meth:`toggle`.  Call again
+        after registering more cheats.
+        """
+
+        namespace: Dict[str, Callable] = {"_unregistered": self._report_unregistered}
+        lines = ["def dispatch(identifier):"]
+        for feature in self.features:
+            if feature is None:
+                continue
+            feature.toggle_bound = partial(feature.toggle, self.process, self.resolved)
+            name = f"_toggle_{feature.identifier.name.lower()}"
+            namespace[name] = feature.toggle_bound
+            lines.append(f"    if identifier == {int(feature.identifier)}:")
+            lines.append(f"        return {name}()")
+        lines.append("    _unregistered(identifier)")
+        exec("\n".join(lines), namespace)
+        self.dispatch = namespace["dispatch"]
+
+    def refresh(self) -> None:
+        """Re-resolve every address chain, for example after the game reloads a level.
+
+        Enabled cheats are switched off at their old addresses and back on at
+        the new ones, and :attr:`dispatch` is recompiled to bind the new
+        addresses.
+        """
+
+        active = [feature for feature in self.features if feature is not None and feature.enabled]
+        for feature in active:
+            feature.toggle(self.process, self.resolved)
+        self.process.invalidate()
+        self.resolved = resolve_all(self.process, self.config)
+        for feature in active:
+            feature.toggle(self.process, self.resolved)
+        self.compile_dispatch()
+
+    @staticmethod
+    def _report_unregistered(identifier: CheatId) -> None:
+        logger.error("Cheat '%s' is not registered", identifier.name)
 
 
 # ---------------------------------------------------------------------------
 # Cheat callback implementations
 # ---------------------------------------------------------------------------
 
-def toggle_infinite_soap(process: AttachedProcess, config: GameConfig, enabled: bool) -> None:
+def toggle_infinite_soap(
+    process: AttachedProcess, resolved: ResolvedAddresses, enabled: bool
+) -> bool:
     """Enable or disable the Infinite Soap cheat.
 
-    TODO: Write to ``config.base_addresses["soap"]`` once the actual pointer
-    chain is known for both v1 and v2.  Use :func:`log_address_chain` during
-    development to validate the addresses.
+    Enabling pins the soap quantity at ``resolved.soap`` to its current value
+    on a background thread; disabling stops the rewrite loop.
     """
 
-    address = config.base_addresses["soap"]
-    log_address_chain("soap", address)
-    logger.debug(
-        "(Infinite Soap) Would %s memory at %s for process %s",
-        "freeze" if enabled else "release",
-        address.describe(),
-        process.pid,
-    )
+    if not resolved.soap:
+        logger.warning("(Infinite Soap) Address is not resolved; nothing to do.")
+        return False
+    if not enabled:
+        process.unfreeze(resolved.soap)
+        return True
+    try:
+        process.freeze(resolved.soap)
+    except MemoryAccessError as exc:
+        logger.warning("(Infinite Soap) %s", exc)
+        return False
+    return True
 
 
-def toggle_instant_clean(process: AttachedProcess, config: GameConfig, enabled: bool) -> None:
+def toggle_instant_clean(
+    process: AttachedProcess, resolved: ResolvedAddresses, enabled: bool
+) -> bool:
     """Enable or disable the Instant Clean cheat.
 
-    TODO: Implement the hook using ``config.function_hooks["instant_clean"]``.
-    The legacy trainer likely used a code injection here; mirror that approach
-    once updated offsets are available.
+    TODO: Implement the hook at ``resolved.instant_clean``.  The legacy trainer
+    likely used a code injection here; mirror that approach once updated
+    offsets are available.
     """
 
-    hook = config.function_hooks["instant_clean"]
-    log_address_chain("instant_clean", hook)
-    logger.debug(
-        "(Instant Clean) Would %s hook at %s for process %s",
-        "install" if enabled else "remove",
-        hook.describe(),
-        process.pid,
-    )
+    if not resolved.instant_clean:
+        logger.warning("(Instant Clean) Hook is not resolved; nothing to do.")
+        return False
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "(Instant Clean) Would %s hook at 0x%X for process %s",
+            "install" if enabled else "remove",
+            resolved.instant_clean,
+            process.pid,
+        )
+    return True
 
 
-def toggle_flight(process: AttachedProcess, config: GameConfig, enabled: bool) -> None:
+def toggle_flight(process: AttachedProcess, resolved: ResolvedAddresses, enabled: bool) -> bool:
     """Enable or disable the Flight cheat.
 
     TODO: Identify whether flight toggles rely on a boolean flag or velocity
-    manipulation.  Once confirmed, update the write logic using
-    ``config.base_addresses["flight"]``.
+    manipulation.  Once confirmed, write to ``resolved.flight``.
     """
 
-    address = config.base_addresses["flight"]
-    log_address_chain("flight", address)
-    logger.debug(
-        "(Flight) Would set flight flag to %s at %s for process %s",
-        enabled,
-        address.describe(),
-        process.pid,
-    )
+    if not resolved.flight:
+        logger.warning("(Flight) Address is not resolved; nothing to do.")
+        return False
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "(Flight) Would set flight flag to %s at 0x%X for process %s",
+            enabled,
+            resolved.flight,
+            process.pid,
+        )
+    return True
 
 
-def toggle_dirt_esp(process: AttachedProcess, config: GameConfig, enabled: bool) -> None:
+def toggle_dirt_esp(process: AttachedProcess, resolved: ResolvedAddresses, enabled: bool) -> bool:
     """Enable or disable the Dirt ESP cheat.
 
     TODO: Confirm whether this feature manipulates a function hook or simply
-    extends a timer.  Replace the log statement with the actual memory writes.
+    extends a timer.  Replace the log statement with the actual memory writes
+    to ``resolved.dirt_esp``.
     """
 
-    hook = config.function_hooks["dirt_esp"]
-    log_address_chain("dirt_esp", hook)
-    logger.debug(
-        "(Dirt ESP) Would %s visualization hook at %s for process %s",
-        "enable" if enabled else "disable",
-        hook.describe(),
-        process.pid,
-    )
+    if not resolved.dirt_esp:
+        logger.warning("(Dirt ESP) Hook is not resolved; nothing to do.")
+        return False
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "(Dirt ESP) Would %s visualization hook at 0x%X for process %s",
+            "enable" if enabled else "disable",
+            resolved.dirt_esp,
+            process.pid,
+        )
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -137,7 +231,7 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         "--game-version",
         "-g",
         default="v1",
-        choices=sorted(SUPPORTED_GAMES.keys()),
+        choices=SUPPORTED_GAME_CHOICES,
         help="Target game version (default: v1)",
     )
     parser.add_argument(
@@ -157,42 +251,120 @@ def configure_logging(verbosity: int) -> None:
     elif verbosity >= 2:
         level = logging.DEBUG
 
-    logging.basicConfig(level=level, format="[%(levelname)s] %(name)s: %(message)s")
+    # The format never shows thread/process details, so skip collecting them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    root = logging.getLogger()
+    if root.handlers:  # already configured, same as logging.basicConfig
+        return
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
+    root.addHandler(handler)
+    root.setLevel(level)
 
 
 def build_manager(config: GameConfig) -> CheatManager:
     process = attach_to_process(config)
-    manager = CheatManager(process, config)
-    manager.register("soap", toggle_infinite_soap)
-    manager.register("instant_clean", toggle_instant_clean)
-    manager.register("flight", toggle_flight)
-    manager.register("dirt_esp", toggle_dirt_esp)
+    manager = CheatManager(process, config, resolve_all(process, config))
+    manager.register(CheatId.SOAP, toggle_infinite_soap)
+    manager.register(CheatId.INSTANT_CLEAN, toggle_instant_clean)
+    manager.register(CheatId.FLIGHT, toggle_flight)
+    manager.register(CheatId.DIRT_ESP, toggle_dirt_esp)
+    manager.compile_dispatch()
     return manager
 
 
+# Cheats in menu order; menu key "1" is the first entry.
+_DISPATCH: Tuple[CheatId, ...] = (
+    CheatId.SOAP,
+    CheatId.INSTANT_CLEAN,
+    CheatId.FLIGHT,
+    CheatId.DIRT_ESP,
+)
+
+_CHEAT_KEYS: Dict[str, CheatId] = {
+    str(number): identifier for number, identifier in enumerate(_DISPATCH, start=1)
+}
+
+
 def display_menu() -> None:
-    print("\n=== Trippy's Deluxe Washer 2 ===")
-    for key, description in MENU_OPTIONS.items():
-        print(f"[{key}] {description}")
+    sys.stdout.flush()  # keep earlier print() output ahead of the raw write
+    os.write(sys.stdout.fileno(), MENU_BYTES)
+
+
+@contextlib.contextmanager
+def _single_key_input():
+    """Deliver key presses without waiting for Enter while the menu is running."""
+
+    if os.name == "nt" or not sys.stdin.isatty():
+        yield
+        return
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    try:
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+def _read_keys_nonblocking(timeout: float) -> Optional[str]:
+    """Return pending key presses, ``None`` on timeout, or ``""`` at end of input."""
+
+    if os.name == "nt":
+        if not sys.stdin.isatty():
+            # msvcrt only sees the console; read redirected input (blocking) so
+            # that end of input still exits the menu.
+            return os.read(sys.stdin.fileno(), 8).decode(errors="replace")
+        deadline = time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+        return msvcrt.getwch()
+
+    fd = sys.stdin.fileno()
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if not ready:
+        return None
+    return os.read(fd, 8).decode(errors="replace")
+
+
+def pump_background_tasks(manager: CheatManager) -> float:
+    """Run due background work and return how long the next key poll may wait."""
+
+    delay = manager.process.pump_freezers()
+    return KEY_POLL_TIMEOUT if delay is None else min(KEY_POLL_TIMEOUT, delay)
 
 
 def run_menu(manager: CheatManager) -> None:
-    while True:
+    with _single_key_input():
         display_menu()
-        choice = input("> ").strip().lower()
-        if choice == "q":
-            print("Exiting cheat menu. Happy washing!")
-            break
-        elif choice == "1":
-            manager.toggle("soap")
-        elif choice == "2":
-            manager.toggle("instant_clean")
-        elif choice == "3":
-            manager.toggle("flight")
-        elif choice == "4":
-            manager.toggle("dirt_esp")
-        else:
-            print("Invalid option. Please try again.")
+        timeout = KEY_POLL_TIMEOUT
+        while True:
+            keys = _read_keys_nonblocking(timeout)
+            if keys == "":
+                print("\nExiting cheat menu. Happy washing!")
+                return
+            for key in keys or ():
+                if key.isspace():
+                    continue
+                choice = key.lower()
+                print(choice)
+                identifier = _CHEAT_KEYS.get(choice)
+                if identifier is not None:
+                    manager.dispatch(identifier)
+                elif choice == "r":
+                    manager.refresh()
+                elif choice == "q":
+                    print("Exiting cheat menu. Happy washing!")
+                    return
+                else:
+                    print("Invalid option. Please try again.")
+                display_menu()
+            timeout = pump_background_tasks(manager)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -218,7 +390,10 @@ def main(argv: list[str] | None = None) -> int:
         )
         return 1
 
-    run_menu(manager)
+    try:
+        run_menu(manager)
+    finally:
+        manager.process.close()
     return 0
 
 
@@ -1,14 +1,21 @@
 """Utility helpers for interacting with the target PowerWash Simulator process.
 
-This module only provides lightweight scaffolding so that the trainer can be
-ported between different game versions.  Actual memory scanning or injection is
-intentionally left out and will be integrated later.
+This module provides lightweight scaffolding so that the trainer can be ported
+between different game versions.  Memory is accessed through
+``ReadProcessMemory``/``WriteProcessMemory`` on Windows and ``/proc/<pid>/mem``
+(falling back to ``process_vm_readv``/``process_vm_writev``) on Linux; scanning
+and code injection are intentionally left out and will be integrated later.
 """
 from __future__ import annotations
 
+import atexit
+import ctypes
 import logging
-from dataclasses import dataclass
-from typing import Optional
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
 
 from game_config import GameConfig, MemoryAddress
 
@@ -19,18 +26,405 @@ class ProcessNotFoundError(RuntimeError):
     """Raised when the target game process is not found."""
 
 
-@dataclass
+class MemoryAccessError(RuntimeError):
+    """Raised when reading from or writing to the target process memory fails."""
+
+
+# Access rights required for reading and patching the game's memory.
+PROCESS_VM_OPERATION = 0x0008
+PROCESS_VM_READ = 0x0010
+PROCESS_VM_WRITE = 0x0020
+
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+MAX_PATH = 260
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", ctypes.c_uint32),
+        ("cntUsage", ctypes.c_uint32),
+        ("th32ProcessID", ctypes.c_uint32),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", ctypes.c_uint32),
+        ("cntThreads", ctypes.c_uint32),
+        ("th32ParentProcessID", ctypes.c_uint32),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", ctypes.c_uint32),
+        ("szExeFile", ctypes.c_wchar * MAX_PATH),
+    ]
+
+
+if os.name == "nt":  # pragma: no cover - only exercised on Windows
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.OpenProcess.argtypes = (ctypes.c_uint32, ctypes.c_int, ctypes.c_uint32)
+    _kernel32.OpenProcess.restype = ctypes.c_void_p
+    _kernel32.ReadProcessMemory.argtypes = (
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_size_t),
+    )
+    _kernel32.ReadProcessMemory.restype = ctypes.c_int
+    _kernel32.WriteProcessMemory.argtypes = _kernel32.ReadProcessMemory.argtypes
+    _kernel32.WriteProcessMemory.restype = ctypes.c_int
+    _kernel32.CloseHandle.argtypes = (ctypes.c_void_p,)
+    _kernel32.CloseHandle.restype = ctypes.c_int
+    _kernel32.CreateToolhelp32Snapshot.argtypes = (ctypes.c_uint32, ctypes.c_uint32)
+    _kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+    _kernel32.Process32FirstW.argtypes = (ctypes.c_void_p, ctypes.POINTER(PROCESSENTRY32W))
+    _kernel32.Process32FirstW.restype = ctypes.c_int
+    _kernel32.Process32NextW.argtypes = (ctypes.c_void_p, ctypes.POINTER(PROCESSENTRY32W))
+    _kernel32.Process32NextW.restype = ctypes.c_int
+else:
+    _kernel32 = None
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+def _load_process_vm_functions():
+    """Return ``(process_vm_readv, process_vm_writev)`` from libc, if present."""
+
+    if _kernel32 is not None:
+        return None, None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        readv, writev = libc.process_vm_readv, libc.process_vm_writev
+    except (OSError, AttributeError):  # not Linux, or a libc without the calls
+        return None, None
+    for function in (readv, writev):
+        function.argtypes = (
+            ctypes.c_int,
+            ctypes.POINTER(_IoVec),
+            ctypes.c_ulong,
+            ctypes.POINTER(_IoVec),
+            ctypes.c_ulong,
+            ctypes.c_ulong,
+        )
+        function.restype = ctypes.c_ssize_t
+    return readv, writev
+
+
+_process_vm_readv, _process_vm_writev = _load_process_vm_functions()
+
+
+def _process_vm_transfer(
+    function, verb: str, pid: int, address: int, buffer: ctypes.Array
+) -> None:
+    """Copy ``buffer`` to or from ``address`` in ``pid`` with a single syscall."""
+
+    if function is None:
+        raise MemoryAccessError(
+            f"Memory access is not supported on this platform ({os.name})."
+        )
+    size = ctypes.sizeof(buffer)
+    local = _IoVec(ctypes.cast(buffer, ctypes.c_void_p), size)
+    remote = _IoVec(address, size)
+    transferred = function(pid, ctypes.byref(local), 1, ctypes.byref(remote), 1, 0)
+    if transferred != size:
+        error = ctypes.get_errno() if transferred < 0 else 0
+        raise MemoryAccessError(
+            f"Failed to {verb} {size} bytes at 0x{address:08X} "
+            f"({os.strerror(error) if error else 'partial transfer'})."
+        )
+
+
+def _read_mem(pid: int, address: int, buffer: ctypes.Array) -> None:
+    _process_vm_transfer(_process_vm_readv, "read", pid, address, buffer)
+
+
+def _write_mem(pid: int, address: int, buffer: ctypes.Array) -> None:
+    _process_vm_transfer(_process_vm_writev, "write", pid, address, buffer)
+
+
+def _proc_mem_transfer(
+    function, verb: str, fd: int, address: int, buffer: ctypes.Array
+) -> None:
+    """Copy ``buffer`` to or from ``address`` through a ``/proc/<pid>/mem`` descriptor."""
+
+    size = ctypes.sizeof(buffer)
+    if address >= 1 << 63:  # beyond the signed off_t that preadv/pwritev accept
+        raise MemoryAccessError(
+            f"Failed to {verb} {size} bytes at 0x{address:08X} (Bad address)."
+        )
+    try:
+        transferred = function(fd, [memoryview(buffer).cast("B")], address)
+    except OSError as exc:
+        raise MemoryAccessError(
+            f"Failed to {verb} {size} bytes at 0x{address:08X} ({exc.strerror})."
+        ) from exc
+    if transferred != size:
+        raise MemoryAccessError(
+            f"Failed to {verb} {size} bytes at 0x{address:08X} (partial transfer)."
+        )
+
+
+def _open_process_handle(pid: int) -> Optional[int]:
+    """Open ``pid`` for memory access and return the raw OS handle.
+
+    On Windows this is an ``OpenProcess`` handle.  Elsewhere it is a file
+    descriptor for ``/proc/<pid>/mem``, or ``None`` when that file is missing
+    or access is denied (for example by Yama's ``ptrace_scope``), in which case
+    memory is accessed by pid through ``process_vm_readv``/``process_vm_writev``.
+    """
+
+    if _kernel32 is None:
+        try:
+            return os.open(f"/proc/{pid}/mem", os.O_RDWR)
+        except OSError as exc:
+            logger.debug("Cannot open /proc/%s/mem (%s); using process_vm_*", pid, exc)
+            return None
+    handle = _kernel32.OpenProcess(
+        PROCESS_VM_READ | PROCESS_VM_WRITE | PROCESS_VM_OPERATION, False, pid
+    )
+    if not handle:
+        raise ProcessNotFoundError(
+            f"Unable to open process {pid} (error {ctypes.get_last_error()}). "
+            "Try running the trainer as administrator."
+        )
+    return handle
+
+
+@dataclass(slots=True, eq=False)
 class AttachedProcess:
     """Represents a handle to the running game process.
 
-    The implementation is intentionally minimal.  When a memory library is
-    plugged in, replace the `handle` attribute with whatever object that
-    library returns (for example, a pymem instance).
+    ``handle`` holds the raw ``OpenProcess`` handle on Windows and a
+    ``/proc/<pid>/mem`` file descriptor on Linux (see
+    :func:`_open_process_handle`).  The handle stays open for the whole session
+    so that every read and write reuses it; call :meth:`close` to release it.
     """
 
     name: str
     pid: int
-    handle: Optional[object] = None
+    handle: Optional[int] = None
+    _resolved: Dict[MemoryAddress, int] = field(default_factory=dict, repr=False)
+    _freezers: Dict[int, MemoryFreezer] = field(default_factory=dict, repr=False)
+
+    def read_into(self, address: int, buffer: ctypes.Array) -> None:
+        """Fill ``buffer`` with ``ctypes.sizeof(buffer)`` bytes read from ``address``."""
+
+        if _kernel32 is None:
+            if self.handle is None:
+                _read_mem(self.pid, address, buffer)
+            else:
+                _proc_mem_transfer(os.preadv, "read", self.handle, address, buffer)
+            return
+        size = ctypes.sizeof(buffer)
+        read = ctypes.c_size_t()
+        ok = _kernel32.ReadProcessMemory(
+            self.handle, ctypes.c_void_p(address), buffer, size, ctypes.byref(read)
+        )
+        if not ok or read.value != size:
+            raise MemoryAccessError(
+                f"Failed to read {size} bytes at 0x{address:08X} "
+                f"(error {ctypes.get_last_error()})."
+            )
+
+    def write_from(self, address: int, buffer: ctypes.Array) -> None:
+        """Write the contents of ``buffer`` to ``address``."""
+
+        if _kernel32 is None:
+            if self.handle is None:
+                _write_mem(self.pid, address, buffer)
+            else:
+                _proc_mem_transfer(os.pwritev, "write", self.handle, address, buffer)
+            return
+        size = ctypes.sizeof(buffer)
+        written = ctypes.c_size_t()
+        ok = _kernel32.WriteProcessMemory(
+            self.handle, ctypes.c_void_p(address), buffer, size, ctypes.byref(written)
+        )
+        if not ok or written.value != size:
+            raise MemoryAccessError(
+                f"Failed to write {size} bytes at 0x{address:08X} "
+                f"(error {ctypes.get_last_error()})."
+            )
+
+    def read_chain(self, address: MemoryAddress) -> int:
+        """Follow the pointer chain described by ``address`` and return the final address.
+
+        The base is dereferenced, then every offset but the last is added and
+        dereferenced in turn; the last offset is added to the final pointer.
+        Each hop depends on the previous one so it costs one read syscall, but
+        all hops share a single preallocated buffer instead of allocating a new
+        object per read.
+        """
+
+        if not address.base:
+            raise MemoryAccessError("Address chain has not been configured yet.")
+        if not address.offsets:
+            return address.base
+
+        buffer = (ctypes.c_uint64 * 1)()
+        self.read_into(address.base, buffer)
+        for offset in address.offsets[:-1]:
+            self.read_into(buffer[0] + offset, buffer)
+        return buffer[0] + address.offsets[-1]
+
+    def resolve(self, address: MemoryAddress) -> int:
+        """Return the final address of ``address``, walking the chain only once.
+
+        Results are cached until :meth:`invalidate` is called, which the
+        menu's refresh option does when the game reloads the structures the
+        chains point into (for example after loading another level).
+        """
+
+        resolved = self._resolved.get(address)
+        if resolved is None:
+            resolved = self._resolved[address] = self.read_chain(address)
+        return resolved
+
+    def invalidate(self) -> None:
+        """Forget every cached pointer chain."""
+
+        self._resolved.clear()
+
+    def freeze(self, address: int) -> None:
+        """Pin the 32-bit integer at ``address`` to its current value."""
+
+        existing = self._freezers.get(address)
+        if existing is not None:
+            if existing.active:
+                return
+            existing.stop()  # its loop died on a failed write; start a fresh one
+        buffer = (ctypes.c_int32 * 1)()
+        self.read_into(address, buffer)
+        freezer = MemoryFreezer(self, address, buffer[0])
+        freezer.start()
+        self._freezers[address] = freezer
+
+    def unfreeze(self, address: int) -> None:
+        """Stop rewriting ``address``; a no-op if it is not frozen."""
+
+        freezer = self._freezers.pop(address, None)
+        if freezer is not None:
+            freezer.stop()
+
+    def close(self) -> None:
+        """Stop all freeze loops and release the OS handle.  Safe to call twice."""
+
+        for address in list(self._freezers):
+            self.unfreeze(address)
+        if self.handle is None:
+            return
+        if _kernel32 is not None:
+            _kernel32.CloseHandle(self.handle)
+        else:
+            os.close(self.handle)
+        self.handle = None
+
+    def pump_freezers(self) -> Optional[float]:
+        """Give every Python-driven freeze loop a chance to rewrite its value.
+
+        Returns the number of seconds until the next rewrite is due, or ``None``
+        if no freeze loop needs pumping.
+        """
+
+        delays = [freezer.tick() for freezer in self._freezers.values()]
+        return min((delay for delay in delays if delay is not None), default=None)
+
+
+FREEZE_INTERVAL = 0.016  # seconds; roughly one write per frame at 60 FPS
+
+
+def _load_freeze_library() -> Optional[ctypes.CDLL]:
+    """Load the compiled ``freeze.c`` helper if it has been built next to this file."""
+
+    if os.name != "nt":
+        return None
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "freeze.dll")
+    try:  # pragma: no cover - only exercised on Windows with the helper built
+        library = ctypes.CDLL(path, use_last_error=True)
+    except OSError:
+        logger.debug("freeze.dll not found; using the Python freeze loop")
+        return None
+    library.freeze_loop.argtypes = (
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.c_int,
+        ctypes.POINTER(ctypes.c_int),
+    )
+    library.freeze_loop.restype = None
+    return library
+
+
+_freeze_library = _load_freeze_library()
+
+
+class MemoryFreezer:
+    """Keeps a 32-bit integer in the game pinned to a fixed value.
+
+    When ``freeze.dll`` (built from ``freeze.c``) is available the rewrite loop
+    runs in C on a background thread without holding the GIL.  Otherwise the
+    menu loop drives the freeze by calling :meth:`tick` between key polls,
+    reusing one preallocated buffer.
+    """
+
+    def __init__(self, process: AttachedProcess, address: int, value: int) -> None:
+        self.process = process
+        self.address = address
+        self._buffer = (ctypes.c_int32 * 1)(value)
+        self._stop = ctypes.c_int(0)
+        self._thread: Optional[threading.Thread] = None
+        self._next_write = 0.0
+
+    def start(self) -> None:
+        self._stop.value = 0
+        if _freeze_library is None:
+            return
+        self._thread = threading.Thread(
+            target=self._run_native, name="memory-freezer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def active(self) -> bool:
+        """``False`` once stopped or after the rewrite loop gave up on a failed write."""
+
+        return not self._stop.value
+
+    def stop(self) -> None:
+        self._stop.value = 1
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def tick(self) -> Optional[float]:
+        """Rewrite the value if the Python loop is in use and the interval elapsed.
+
+        Returns the seconds until the next rewrite is due, or ``None`` when the
+        native loop is in use or the freeze has stopped.
+        """
+
+        if self._thread is not None or self._stop.value:
+            return None
+        now = time.monotonic()
+        if now < self._next_write:
+            return self._next_write - now
+        self._next_write = now + FREEZE_INTERVAL
+        try:
+            self.process.write_from(self.address, self._buffer)
+        except MemoryAccessError as exc:
+            logger.warning("Stopped freezing 0x%X: %s", self.address, exc)
+            self._stop.value = 1
+            return None
+        return FREEZE_INTERVAL
+
+    def _run_native(self) -> None:
+        _freeze_library.freeze_loop(
+            self.process.handle, self.address, self._buffer[0], ctypes.byref(self._stop)
+        )
+        if not self._stop.value:
+            logger.warning(
+                "Stopped freezing 0x%X: WriteProcessMemory failed (error %s)",
+                self.address,
+                ctypes.get_last_error(),
+            )
+            self._stop.value = 1
 
 
 try:  # pragma: no cover - psutil is optional in the execution environment
@@ -39,40 +433,170 @@ except ImportError:  # pragma: no cover - allow the trainer to run without psuti
     psutil = None
 
 
-def find_process_by_name(process_name: str) -> psutil.Process:
-    """Return the first running process matching ``process_name``.
+def _find_pid_toolhelp(process_name: str) -> Optional[int]:
+    """Scan a Toolhelp32 process snapshot; no per-process ``OpenProcess`` calls."""
+
+    snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot in (None, INVALID_HANDLE_VALUE):
+        raise ProcessNotFoundError(
+            f"Unable to enumerate processes (error {ctypes.get_last_error()})."
+        )
+    try:
+        target = process_name.casefold()
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.casefold() == target:
+                return entry.th32ProcessID
+            found = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return None
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+
+def _procfs_full_names(pid: str) -> Tuple[str, ...]:
+    """Return the untruncated names ``/proc/<pid>`` knows the process by, casefolded.
 
-    Raises ``ProcessNotFoundError`` if the process cannot be found or if the
-    optional :mod:`psutil` dependency is unavailable.  When the dependency is
-    missing we raise an actionable message so that users understand how to
-    install it before re-running the trainer.
+    Windows builds of the game run under Wine/Proton, where ``exe`` points at
+    the wine loader; the Windows path in ``argv[0]`` still carries the game's
+    executable name.
     """
 
-    if psutil is None:
+    names = []
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as cmdline:
+            argv0 = cmdline.read().split(b"\0", 1)[0]
+        names.append(argv0.replace(b"\\", b"/").rsplit(b"/", 1)[-1])
+        names.append(os.path.basename(os.readlink(f"/proc/{pid}/exe")).encode())
+    except OSError:  # process exited, or exe belongs to another user
+        pass
+    return tuple(name.decode(errors="replace").casefold() for name in names)
+
+
+def _find_pid_procfs(process_name: str) -> Optional[int]:
+    """Scan ``/proc`` for a process running the executable ``process_name``.
+
+    Only ``comm`` is read for every pid: it holds the executable name truncated
+    to 15 characters, both natively and under Wine.  ``cmdline`` and ``exe`` are
+    read just for the processes whose ``comm`` matches, to confirm longer names.
+    """
+
+    target = process_name.casefold()
+    comm_target = target[:15]  # TASK_COMM_LEN - 1
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:  # raw fd: no buffered file object per pid
+                fd = os.open(f"/proc/{entry.name}/comm", os.O_RDONLY)
+            except OSError:  # process exited
+                continue
+            try:
+                name = os.read(fd, 64).rstrip(b"\n").decode(errors="replace")
+            except OSError:
+                continue
+            finally:
+                os.close(fd)
+            if name.casefold() != comm_target:
+                continue
+            if len(target) <= 15 or target in _procfs_full_names(entry.name):
+                return int(entry.name)
+    return None
+
+
+def _find_pid_psutil(process_name: str) -> Optional[int]:
+    for process in psutil.process_iter(["name"]):
+        if process.info.get("name") == process_name:
+            return process.pid
+    return None
+
+
+def find_process_by_name(process_name: str) -> int:
+    """Return the pid of the first running process matching ``process_name``.
+
+    Windows uses a Toolhelp32 snapshot and Linux scans ``/proc`` directly; other
+    platforms fall back to the optional :mod:`psutil` dependency.  Raises
+    ``ProcessNotFoundError`` if the process cannot be found or if no lookup
+    method is available, with an actionable message so that users understand
+    how to fix it before re-running the trainer.
+    """
+
+    if os.name == "nt":
+        pid = _find_pid_toolhelp(process_name)
+    elif os.path.isdir("/proc"):
+        pid = _find_pid_procfs(process_name)
+    elif psutil is not None:
+        pid = _find_pid_psutil(process_name)
+    else:
         raise ProcessNotFoundError(
             "psutil is not installed. Install it with 'pip install psutil' "
             "before attempting to attach to the game process."
         )
 
-    for process in psutil.process_iter(["name"]):
-        if process.info.get("name") == process_name:
-            return process
-    raise ProcessNotFoundError(
-        f"Could not locate running process '{process_name}'. Make sure the game "
-        "is running before enabling cheats."
-    )
+    if pid is None:
+        raise ProcessNotFoundError(
+            f"Could not locate running process '{process_name}'. Make sure the game "
+            "is running before enabling cheats."
+        )
+    return pid
 
 
 def attach_to_process(config: GameConfig) -> AttachedProcess:
     """Attach to the game process described by ``config``."""
 
     logger.debug("Attempting to attach to %s", config.process_name)
-    process = find_process_by_name(config.process_name)
-    logger.info("Attached to %s (pid=%s)", config.process_name, process.pid)
-    return AttachedProcess(name=config.process_name, pid=process.pid, handle=None)
+    pid = find_process_by_name(config.process_name)
+    handle = _open_process_handle(pid)
+    logger.info("Attached to %s (pid=%s)", config.process_name, pid)
+    process = AttachedProcess(name=config.process_name, pid=pid, handle=handle)
+    atexit.register(process.close)
+    return process
+
+
+@dataclass(frozen=True)
+class ResolvedAddresses:
+    """Final address of every cheat target, resolved at attach time.
+
+    The game moves these structures when it reloads a level; invalidate the
+    process cache and call :func:`resolve_all` again to get fresh addresses.
+
+    A value of ``0`` means the chain could not be resolved, for example because
+    its offsets are still placeholders.
+    """
+
+    soap: int = 0
+    instant_clean: int = 0
+    flight: int = 0
+    dirt_esp: int = 0
+
+
+def resolve_all(process: AttachedProcess, config: GameConfig) -> ResolvedAddresses:
+    """Resolve the address chain of every cheat in ``config`` up front.
+
+    The chains only change when the game reloads, so toggling a cheat never has
+    to walk them again.  Chains that cannot be resolved are logged and left as
+    ``0``.
+    """
+
+    chains = {
+        "soap": config.base_addresses["soap"],
+        "instant_clean": config.function_hooks["instant_clean"],
+        "flight": config.base_addresses["flight"],
+        "dirt_esp": config.function_hooks["dirt_esp"],
+    }
+    resolved: Dict[str, int] = {}
+    for label, address in chains.items():
+        log_address_chain(label, address)
+        try:
+            resolved[label] = process.resolve(address)
+        except MemoryAccessError as exc:
+            logger.warning("Could not resolve %s: %s", label, exc)
+    return ResolvedAddresses(**resolved)
 
 
 def log_address_chain(label: str, address: MemoryAddress) -> None:
     """Convenience helper that logs address chains for documentation purposes."""
 
-    logger.debug("%s address chain: %s", label, address.describe())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s address chain: %s", label, address.describe())